@@ -3,10 +3,13 @@ import Product from "../models/Product.js";
 import Sale from "../models/Sale.js";
 import InventoryBatch from "../models/InventoryBatch.js";
 import { catchAsync } from "../middleware/errorHandler.js";
+import config from "../config/config.js";
 
 // Get comprehensive dashboard overview - FIXED
 export const getDashboardOverview = catchAsync(async (req, res, next) => {
-  console.log("🔍 Dashboard Overview - Starting data aggregation...");
+  if (config.isDevelopment) {
+    console.log("🔍 Dashboard Overview - Starting data aggregation...");
+  }
 
   const { startDate, endDate } = req.query;
 
@@ -22,7 +25,9 @@ export const getDashboardOverview = catchAsync(async (req, res, next) => {
   const tomorrow = new Date(today);
   tomorrow.setDate(tomorrow.getDate() + 1);
 
-  console.log("📅 Date range:", { start, end, today, tomorrow });
+  if (config.isDevelopment) {
+    console.log("📅 Date range:", { start, end, today, tomorrow });
+  }
 
   try {
     // Parallel execution of all dashboard queries with better error handling
@@ -255,10 +260,13 @@ export const getDashboardOverview = catchAsync(async (req, res, next) => {
         console.error("❌ Sales by category error:", err);
         return [];
       }).then((result) => {
-        console.log("🏷️ Category Distribution Debug:");
-        console.log("- Date range:", { start, end });
-        console.log("- Raw result:", result);
-        console.log("- Result count:", result?.length || 0);
+        if (config.isDevelopment) {
+          console.log("🏷️ Category Distribution Debug:", {
+            dateRange: { start, end },
+            resultCount: result?.length || 0,
+            result,
+          });
+        }
         return result;
       }),
 
@@ -289,16 +297,18 @@ export const getDashboardOverview = catchAsync(async (req, res, next) => {
       }),
     ]);
 
-    console.log("📊 Aggregation results status:", {
-      productStats: productStats.status,
-      salesStats: salesStats.status,
-      todayStats: todayStats.status,
-      lowStockProducts: lowStockProducts.status,
-      recentSales: recentSales.status,
-      topProducts: topProducts.status,
-      categoryDistribution: categoryDistribution.status,
-      monthlySalesData: monthlySalesData.status,
-    });
+    if (config.isDevelopment) {
+      console.log("📊 Aggregation results status:", {
+        productStats: productStats.status,
+        salesStats: salesStats.status,
+        todayStats: todayStats.status,
+        lowStockProducts: lowStockProducts.status,
+        recentSales: recentSales.status,
+        topProducts: topProducts.status,
+        categoryDistribution: categoryDistribution.status,
+        monthlySalesData: monthlySalesData.status,
+      });
+    }
 
     // Extract values from Promise.allSettled results
     const getSettledValue = (result, defaultValue = []) => {
@@ -313,7 +323,9 @@ export const getDashboardOverview = catchAsync(async (req, res, next) => {
     let profitData = { totalProfit: 0, totalRevenue: 0 };
 
     try {
-      console.log("💰 Starting profit calculation...");
+      if (config.isDevelopment) {
+        console.log("💰 Starting profit calculation...");
+      }
 
       // First, check if we have any sales with FIFO data
       const salesWithFIFO = await Sale.findOne({
@@ -321,7 +333,9 @@ export const getDashboardOverview = catchAsync(async (req, res, next) => {
       });
       const hasFIFOData = salesWithFIFO !== null;
 
-      console.log("📊 FIFO data available:", hasFIFOData);
+      if (config.isDevelopment) {
+        console.log("📊 FIFO data available:", hasFIFOData);
+      }
 
       if (hasFIFOData) {
         // Use FIFO profit data if available
@@ -547,7 +561,9 @@ export const getDashboardOverview = catchAsync(async (req, res, next) => {
         profitData.totalProfit += estimatedProfit;
         profitData.totalRevenue += estimatedRevenue;
 
-        console.log("📊 Estimated profit added:", estimatedProfit);
+        if (config.isDevelopment) {
+          console.log("📊 Estimated profit added:", estimatedProfit);
+        }
       }
 
       // Final validation to prevent NaN
@@ -573,7 +589,9 @@ export const getDashboardOverview = catchAsync(async (req, res, next) => {
       profitData.totalProfit = Math.round(profitData.totalProfit * 100) / 100;
       profitData.totalRevenue = Math.round(profitData.totalRevenue * 100) / 100;
 
-      console.log("✅ Final profit data:", profitData);
+      if (config.isDevelopment) {
+        console.log("✅ Final profit data:", profitData);
+      }
     } catch (profitError) {
       console.error("❌ Profit calculation error:", profitError);
       console.error("Error details:", profitError.stack);
@@ -666,15 +684,19 @@ export const getDashboardOverview = catchAsync(async (req, res, next) => {
       ? 0
       : overview.profit.profitMargin;
 
-    console.log("✅ Dashboard overview compiled successfully");
-    console.log("📈 Overview summary:", {
-      totalProducts: overview.products.totalProducts,
-      totalSales: overview.sales.period.totalSales,
-      totalRevenue: overview.sales.period.totalRevenue,
-      totalProfit: overview.profit.totalProfit,
-      profitMargin: overview.profit.profitMargin,
-      lowStockCount: overview.products.lowStockCount,
-    });
+    if (config.isDevelopment) {
+      console.log("✅ Dashboard overview compiled successfully");
+    }
+    if (config.isDevelopment) {
+      console.log("📈 Overview summary:", {
+        totalProducts: overview.products.totalProducts,
+        totalSales: overview.sales.period.totalSales,
+        totalRevenue: overview.sales.period.totalRevenue,
+        totalProfit: overview.profit.totalProfit,
+        profitMargin: overview.profit.profitMargin,
+        lowStockCount: overview.products.lowStockCount,
+      });
+    }
 
     res.status(200).json({
       status: "success",
@@ -727,60 +749,39 @@ export const getDashboardOverview = catchAsync(async (req, res, next) => {
   }
 });
 
+// $dateToString formats for each supported groupBy value
+const ANALYTICS_GROUP_FORMATS = new Map([
+  ["hour", "%Y-%m-%d %H:00"],
+  ["day", "%Y-%m-%d"],
+  ["week", "%Y-W%V"],
+  ["month", "%Y-%m"],
+]);
+
+// Look-back window in days for each supported analytics period
+const ANALYTICS_PERIOD_DAYS = new Map([
+  ["7d", 7],
+  ["30d", 30],
+  ["90d", 90],
+  ["1y", 365],
+]);
+
 // Get sales analytics for charts - FIXED
 export const getSalesAnalytics = catchAsync(async (req, res, next) => {
   const { period = "30d", groupBy = "day" } = req.query;
 
   // Calculate date range based on period
-  let startDate;
   const endDate = new Date();
-
-  switch (period) {
-    case "7d":
-      startDate = new Date(Date.now() - 7 * 24 * 60 * 60 * 1000);
-      break;
-    case "30d":
-      startDate = new Date(Date.now() - 30 * 24 * 60 * 60 * 1000);
-      break;
-    case "90d":
-      startDate = new Date(Date.now() - 90 * 24 * 60 * 60 * 1000);
-      break;
-    case "1y":
-      startDate = new Date(Date.now() - 365 * 24 * 60 * 60 * 1000);
-      break;
-    default:
-      startDate = new Date(Date.now() - 30 * 24 * 60 * 60 * 1000);
-  }
+  const periodDays =
+    ANALYTICS_PERIOD_DAYS.get(period) ?? ANALYTICS_PERIOD_DAYS.get("30d");
+  const startDate = new Date(Date.now() - periodDays * 24 * 60 * 60 * 1000);
 
   // Set grouping format based on groupBy parameter
-  let groupFormat;
-  switch (groupBy) {
-    case "hour":
-      groupFormat = {
-        $dateToString: { format: "%Y-%m-%d %H:00", date: "$createdAt" },
-      };
-      break;
-    case "day":
-      groupFormat = {
-        $dateToString: { format: "%Y-%m-%d", date: "$createdAt" },
-      };
-      break;
-    case "week":
-      groupFormat = {
-        $dateToString: {
-          format: "%Y-W%V",
-          date: "$createdAt",
-        },
-      };
-      break;
-    case "month":
-      groupFormat = { $dateToString: { format: "%Y-%m", date: "$createdAt" } };
-      break;
-    default:
-      groupFormat = {
-        $dateToString: { format: "%Y-%m-%d", date: "$createdAt" },
-      };
-  }
+  const groupFormat = {
+    $dateToString: {
+      format: ANALYTICS_GROUP_FORMATS.get(groupBy) ?? ANALYTICS_GROUP_FORMATS.get("day"),
+      date: "$createdAt",
+    },
+  };
 
   try {
     const analyticsData = await Sale.aggregate([
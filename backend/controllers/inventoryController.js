@@ -2,30 +2,57 @@
 import InventoryBatch from "../models/InventoryBatch.js";
 import Product from "../models/Product.js";
 import { catchAsync, AppError } from "../middleware/errorHandler.js";
+import config from "../config/config.js";
 import mongoose from "mongoose";
 
+// Build an unsaved batch document from validated request fields
+const buildBatch = (
+  {
+    productId,
+    purchaseDate,
+    expiryDate,
+    buyPrice,
+    sellPrice,
+    quantity,
+    supplierName,
+    invoiceNumber,
+    shippingCost = 0,
+    taxAmount = 0,
+    otherCosts = 0,
+    notes,
+  },
+  now
+) =>
+  new InventoryBatch({
+    productId: new mongoose.Types.ObjectId(productId), // Ensure it's an ObjectId
+    purchaseDate: purchaseDate ? new Date(purchaseDate) : now,
+    expiryDate: expiryDate ? new Date(expiryDate) : undefined,
+    buyPrice: Number(buyPrice),
+    sellPrice: Number(sellPrice),
+    initialQuantity: Number(quantity),
+    remainingQuantity: Number(quantity),
+    supplierName: supplierName?.trim() || "Unknown Supplier",
+    invoiceNumber: invoiceNumber?.trim() || `INV-${now.getTime()}`,
+    notes: notes?.trim() || "",
+    costDetails: {
+      shippingCost: Number(shippingCost) || 0,
+      taxAmount: Number(taxAmount) || 0,
+      otherCosts: Number(otherCosts) || 0,
+    },
+    status: "active",
+  });
+
 // Add a new inventory batch - FIXED VERSION
 export const addInventoryBatch = catchAsync(async (req, res, next) => {
   const session = await mongoose.startSession();
   session.startTransaction();
 
   try {
-    const {
-      productId,
-      purchaseDate,
-      expiryDate,
-      buyPrice,
-      sellPrice,
-      quantity,
-      supplierName,
-      invoiceNumber,
-      shippingCost = 0,
-      taxAmount = 0,
-      otherCosts = 0,
-      notes,
-    } = req.body;
-
-    console.log("📦 Adding inventory batch for product:", productId);
+    const { productId, buyPrice, sellPrice, quantity } = req.body;
+
+    if (config.isDevelopment) {
+      console.log("📦 Adding inventory batch for product:", productId);
+    }
 
     // Enhanced validation
     if (!productId || productId.trim() === "") {
@@ -68,77 +95,22 @@ export const addInventoryBatch = catchAsync(async (req, res, next) => {
     }
 
     // Create inventory batch with validated data
-    const batch = new InventoryBatch({
-      productId: new mongoose.Types.ObjectId(productId), // Ensure it's an ObjectId
-      // batchNumber will be auto-generated by the pre-save hook
-      purchaseDate: purchaseDate ? new Date(purchaseDate) : new Date(),
-      expiryDate: expiryDate ? new Date(expiryDate) : undefined,
-      buyPrice: Number(buyPrice),
-      sellPrice: Number(sellPrice),
-      initialQuantity: Number(quantity),
-      remainingQuantity: Number(quantity),
-      supplierName: supplierName?.trim() || "Unknown Supplier",
-      invoiceNumber: invoiceNumber?.trim() || `INV-${Date.now()}`,
-      notes: notes?.trim() || "",
-      costDetails: {
-        shippingCost: Number(shippingCost) || 0,
-        taxAmount: Number(taxAmount) || 0,
-        otherCosts: Number(otherCosts) || 0,
-      },
-      status: "active",
-    });
+    // batchNumber will be auto-generated by the pre-save hook
+    const batch = buildBatch(req.body, new Date());
 
     await batch.save({ session });
 
-    console.log(
-      "✅ Batch created with ID:",
-      batch._id,
-      "Batch Number:",
-      batch.batchNumber
-    );
+    if (config.isDevelopment) {
+      console.log(
+        "✅ Batch created with ID:",
+        batch._id,
+        "Batch Number:",
+        batch.batchNumber
+      );
+    }
 
     // Update product with new calculated values
-    const aggregation = await InventoryBatch.aggregate([
-      {
-        $match: {
-          productId: new mongoose.Types.ObjectId(productId),
-          status: "active",
-          remainingQuantity: { $gt: 0 },
-        },
-      },
-      {
-        $group: {
-          _id: null,
-          totalQuantity: { $sum: "$remainingQuantity" },
-          weightedBuyPrice: {
-            $sum: {
-              $multiply: ["$buyPrice", "$remainingQuantity"],
-            },
-          },
-          weightedSellPrice: {
-            $sum: {
-              $multiply: ["$sellPrice", "$remainingQuantity"],
-            },
-          },
-        },
-      },
-    ]).session(session);
-
-    if (aggregation.length > 0) {
-      const stats = aggregation[0];
-      product.quantity = stats.totalQuantity;
-      product.totalQuantity = stats.totalQuantity;
-      product.currentBuyPrice =
-        stats.totalQuantity > 0
-          ? (stats.weightedBuyPrice / stats.totalQuantity).toFixed(2)
-          : 0;
-      product.currentSellPrice =
-        stats.totalQuantity > 0
-          ? (stats.weightedSellPrice / stats.totalQuantity).toFixed(2)
-          : 0;
-
-      await product.save({ session });
-    }
+    await Product.syncFromActiveBatches([productId], session);
 
     await session.commitTransaction();
 
@@ -161,6 +133,77 @@ export const addInventoryBatch = catchAsync(async (req, res, next) => {
   }
 });
 
+// Add several inventory batches in one transaction
+export const addInventoryBatchesBulk = catchAsync(async (req, res, next) => {
+  const { batches: items } = req.body;
+
+  const session = await mongoose.startSession();
+  session.startTransaction();
+
+  try {
+    // Fetch all referenced products in a single query
+    const productIds = [...new Set(items.map((item) => item.productId))];
+    const products = await Product.find({ _id: { $in: productIds } }).session(
+      session
+    );
+    const productMap = new Map(
+      products.map((product) => [product._id.toString(), product])
+    );
+
+    for (const item of items) {
+      // Map keys are lowercase hex; normalize so uppercase IDs still match
+      const product = productMap.get(
+        new mongoose.Types.ObjectId(item.productId).toString()
+      );
+      if (!product) {
+        throw new AppError(`Product not found: ${item.productId}`, 404);
+      }
+      if (!product.isActive) {
+        throw new AppError(
+          `Cannot add batch to inactive product: ${product.name}`,
+          400
+        );
+      }
+    }
+
+    // One timestamp for the whole request. insertMany does not run the
+    // pre-save hook, so batch numbers and expiry status are applied here.
+    // The item index keeps numbers unique despite the shared timestamp
+    const now = new Date();
+    const batches = items.map((item, index) => {
+      const batch = buildBatch(item, now);
+      batch.batchNumber = `${InventoryBatch.generateBatchNumber(now)}-${index}`;
+      if (batch.expiryDate && batch.expiryDate < now) {
+        batch.status = "expired";
+      }
+      return batch;
+    });
+
+    const insertedBatches = await InventoryBatch.insertMany(batches, {
+      session,
+    });
+
+    // Recompute every touched product from its active batches in one
+    // aggregation, so expired batches are left out like the single path
+    await Product.syncFromActiveBatches(productIds, session);
+
+    await session.commitTransaction();
+
+    res.status(201).json({
+      status: "success",
+      results: insertedBatches.length,
+      data: {
+        batches: insertedBatches,
+      },
+    });
+  } catch (error) {
+    await session.abortTransaction();
+    throw error;
+  } finally {
+    session.endSession();
+  }
+});
+
 // Get all batches for a product
 export const getProductBatches = catchAsync(async (req, res, next) => {
   const { productId } = req.params;
@@ -179,14 +222,21 @@ export const getProductBatches = catchAsync(async (req, res, next) => {
     .sort({ purchaseDate: 1 })
     .populate("productId", "name category");
 
+  // Accumulate all summary totals in a single pass over the batches
+  let activeBatches = 0;
+  let totalQuantity = 0;
+  let totalValue = 0;
+  for (const { status, remainingQuantity, buyPrice } of batches) {
+    if (status === "active") activeBatches++;
+    totalQuantity += remainingQuantity;
+    totalValue += remainingQuantity * buyPrice;
+  }
+
   const summary = {
     totalBatches: batches.length,
-    activeBatches: batches.filter((b) => b.status === "active").length,
-    totalQuantity: batches.reduce((sum, b) => sum + b.remainingQuantity, 0),
-    totalValue: batches.reduce(
-      (sum, b) => sum + b.remainingQuantity * b.buyPrice,
-      0
-    ),
+    activeBatches,
+    totalQuantity,
+    totalValue,
     oldestBatch: batches[0]?.purchaseDate,
     newestBatch: batches[batches.length - 1]?.purchaseDate,
   };
@@ -397,7 +447,8 @@ export const getBatchHistory = catchAsync(async (req, res, next) => {
     "products.batchAllocations.batchId": batchId,
   })
     .select("receiptNumber createdAt products cashierName totalAmount")
-    .sort({ createdAt: -1 });
+    .sort({ createdAt: -1 })
+    .lean();
 
   // Calculate consumption
   const consumption = sales.reduce((acc, sale) => {
@@ -432,6 +483,7 @@ export const getBatchHistory = catchAsync(async (req, res, next) => {
 
 export default {
   addInventoryBatch,
+  addInventoryBatchesBulk,
   getProductBatches,
   getInventoryValuation,
   getExpiringBatches,
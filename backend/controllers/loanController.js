@@ -34,8 +34,8 @@ export const getAllLoans = catchAsync(async (req, res, next) => {
   }
 
   // Calculate pagination
-  const skip = (page - 1) * limit;
   const limitNum = Math.min(limit, config.maxPageSize);
+  const skip = (page - 1) * limitNum;
 
   // Execute query with population
   const loans = await LoanSale.find(filter)
@@ -350,6 +350,13 @@ export const updateLoanStatus = catchAsync(async (req, res, next) => {
   });
 });
 
+// $dateToString formats for each supported groupBy value
+const LOAN_GROUP_FORMATS = new Map([
+  ["day", "%Y-%m-%d"],
+  ["month", "%Y-%m"],
+  ["year", "%Y"],
+]);
+
 // Get loans by date range
 export const getLoansByDateRange = catchAsync(async (req, res, next) => {
   const { startDate, endDate, groupBy = "day" } = req.query;
@@ -359,24 +366,12 @@ export const getLoansByDateRange = catchAsync(async (req, res, next) => {
     : new Date(Date.now() - 30 * 24 * 60 * 60 * 1000);
   const end = endDate ? new Date(endDate) : new Date();
 
-  let groupFormat;
-  switch (groupBy) {
-    case "day":
-      groupFormat = {
-        $dateToString: { format: "%Y-%m-%d", date: "$createdAt" },
-      };
-      break;
-    case "month":
-      groupFormat = { $dateToString: { format: "%Y-%m", date: "$createdAt" } };
-      break;
-    case "year":
-      groupFormat = { $dateToString: { format: "%Y", date: "$createdAt" } };
-      break;
-    default:
-      groupFormat = {
-        $dateToString: { format: "%Y-%m-%d", date: "$createdAt" },
-      };
-  }
+  const groupFormat = {
+    $dateToString: {
+      format: LOAN_GROUP_FORMATS.get(groupBy) ?? LOAN_GROUP_FORMATS.get("day"),
+      date: "$createdAt",
+    },
+  };
 
   const loanData = await LoanSale.aggregate([
     {
@@ -493,47 +488,68 @@ export const createLoanDirect = catchAsync(async (req, res, next) => {
     if (!product.productId || !product.productName || !product.quantity || !product.sellPrice) {
       return next(new AppError("Each product must have productId, productName, quantity, and sellPrice", 400));
     }
+    if (!mongoose.Types.ObjectId.isValid(product.productId)) {
+      return next(new AppError(`Invalid product ID format: ${product.productId}`, 400));
+    }
   }
 
+  // Extract unique product IDs for batch queries
+  const productIds = [...new Set(products.map((p) => p.productId))];
+
   // Start database transaction for FIFO allocation
   const session = await mongoose.startSession();
   session.startTransaction();
 
   try {
+    // Fetch all products in a single query
+    const productDocs = await Product.find({
+      _id: { $in: productIds },
+    }).session(session);
+
+    // Create product lookup map
+    const productMap = new Map();
+    productDocs.forEach((product) => {
+      productMap.set(product._id.toString(), product);
+    });
+
+    // Fetch all batches for all products in a single query
+    const batchData = await InventoryBatch.aggregate([
+      {
+        $match: {
+          productId: { $in: productIds.map((id) => new mongoose.Types.ObjectId(id)) },
+          status: "active",
+          remainingQuantity: { $gt: 0 },
+        },
+      },
+      {
+        $sort: { productId: 1, purchaseDate: 1, createdAt: 1 }, // Group by product, then FIFO
+      },
+    ]).session(session);
+
+    // Index batches by product ID so each allocation only walks its own queue
+    const batchesByProduct = new Map();
+    batchData.forEach((batch) => {
+      const productId = batch.productId.toString();
+      if (!batchesByProduct.has(productId)) {
+        batchesByProduct.set(productId, []);
+      }
+      batchesByProduct.get(productId).push(batch);
+    });
+
     // Process products with FIFO allocation
     const processedProducts = [];
+    const batchUpdates = []; // Collect batch updates for bulk operation
+    const batchHeads = new Map(); // Index of each product's oldest non-depleted batch
     let totalCost = 0;
     let totalProfit = 0;
 
     for (const item of products) {
-      // Get product details
-      const product = await Product.findById(item.productId).session(session);
+      const product = productMap.get(item.productId);
       if (!product) {
         throw new AppError(`Product with ID ${item.productId} not found`, 404);
       }
 
-      // Get available batches in FIFO order (oldest first)
-      const availableBatches = await InventoryBatch.find({
-        productId: item.productId,
-        status: "active",
-        remainingQuantity: { $gt: 0 },
-      })
-        .sort({ purchaseDate: 1, createdAt: 1 }) // FIFO: oldest first
-        .session(session);
-
-      // Calculate total available quantity
-      const totalAvailable = availableBatches.reduce(
-        (sum, batch) => sum + batch.remainingQuantity,
-        0
-      );
-
-      // Check stock availability
-      if (totalAvailable < item.quantity) {
-        throw new AppError(
-          `Insufficient stock for ${product.name}. Available: ${totalAvailable}, Requested: ${item.quantity}`,
-          400
-        );
-      }
+      const availableBatches = batchesByProduct.get(item.productId) || [];
 
       // FIFO allocation
       const batchAllocations = [];
@@ -541,47 +557,55 @@ export const createLoanDirect = catchAsync(async (req, res, next) => {
       let itemCost = 0;
       let itemPrice = 0;
 
-      for (const batch of availableBatches) {
-        if (remainingToAllocate <= 0) break;
+      // Resume from the product's head so batches drained by an earlier
+      // line of this request are not walked (or allocated from) again
+      let head = batchHeads.get(item.productId) || 0;
 
+      while (remainingToAllocate > 0 && head < availableBatches.length) {
+        const batch = availableBatches[head];
         const allocateFromBatch = Math.min(
           remainingToAllocate,
           batch.remainingQuantity
         );
 
-        const allocationCost = allocateFromBatch * batch.buyPrice;
-        const allocationPrice = allocateFromBatch * batch.sellPrice;
-        const allocationProfit = allocationPrice - allocationCost;
+        const { buyPrice, sellPrice } = batch;
+        const allocationCost = allocateFromBatch * buyPrice;
+        const allocationPrice = allocateFromBatch * sellPrice;
 
         itemCost += allocationCost;
         itemPrice += allocationPrice;
 
-        batchAllocations.push({
-          batchId: batch._id,
-          batchNumber: batch.batchNumber,
-          quantity: allocateFromBatch,
-          buyPrice: batch.buyPrice,
-          sellPrice: batch.sellPrice,
-          profit: allocationProfit,
-        });
+        batchAllocations.push(
+          InventoryBatch.buildAllocation(batch, allocateFromBatch)
+        );
 
-        // Update batch remaining quantity
+        // Update batch remaining quantity in memory
         batch.remainingQuantity -= allocateFromBatch;
 
-        // Update batch status if depleted
-        if (batch.remainingQuantity <= 0) {
-          batch.status = "depleted";
-        }
+        // Prepare batch update for bulk operation
+        batchUpdates.push({
+          updateOne: {
+            filter: { _id: batch._id },
+            update: {
+              remainingQuantity: batch.remainingQuantity,
+              status: batch.remainingQuantity === 0 ? "depleted" : "active",
+            },
+          },
+        });
 
-        await batch.save({ session });
         remainingToAllocate -= allocateFromBatch;
+        if (batch.remainingQuantity === 0) head++;
       }
 
-      // Verify all quantity was allocated
+      batchHeads.set(item.productId, head);
+
+      // Stock is only checked once the queue runs out, so a sale covered by the
+      // oldest batch never has to scan the rest of the product's batches
       if (remainingToAllocate > 0) {
+        const totalAvailable = item.quantity - remainingToAllocate;
         throw new AppError(
-          `Failed to allocate full quantity for ${product.name}`,
-          500
+          `Insufficient stock for ${product.name}. Available: ${totalAvailable}, Requested: ${item.quantity}`,
+          400
         );
       }
 
@@ -600,11 +624,16 @@ export const createLoanDirect = catchAsync(async (req, res, next) => {
         totalPrice: itemPrice,
         totalProfit: itemProfit,
       });
+    }
 
-      // Update product total quantity from remaining batches
-      await product.updateFromBatches();
+    // Perform bulk batch updates in a single operation
+    if (batchUpdates.length > 0) {
+      await InventoryBatch.bulkWrite(batchUpdates, { session });
     }
 
+    // Resync loaned products from their batches inside the transaction
+    await Product.syncFromActiveBatches(productIds, session);
+
     // Calculate loan values
     const totalAmountNum = Number(totalAmount);
     const downPaymentNum = Number(downPayment);
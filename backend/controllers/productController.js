@@ -68,8 +68,8 @@ export const getAllProducts = catchAsync(async (req, res, next) => {
   }
 
   // Calculate pagination
-  const skip = (page - 1) * limit;
   const limitNum = Math.min(limit, config.maxPageSize);
+  const skip = (page - 1) * limitNum;
 
   // Execute query with special handling for barcode search
   let query = Product.find(filter);
@@ -98,12 +98,18 @@ export const getAllProducts = catchAsync(async (req, res, next) => {
       products.map(async (product) => {
         const totalAvailable = await InventoryBatch.getTotalAvailableQuantity(product._id);
 
-        // Get oldest batch for FIFO pricing
-        const oldestBatch = await InventoryBatch.findOne({
-          productId: product._id,
-          status: "active",
-          remainingQuantity: { $gt: 0 }
-        }).sort({ purchaseDate: 1 });
+        // Get oldest batch for FIFO pricing (skipped when nothing is in stock)
+        const oldestBatch =
+          totalAvailable > 0
+            ? await InventoryBatch.findOne({
+                productId: product._id,
+                status: "active",
+                remainingQuantity: { $gt: 0 },
+              })
+                .sort({ purchaseDate: 1 })
+                .select("buyPrice sellPrice")
+                .lean()
+            : null;
 
         return {
           ...product,
@@ -147,12 +153,18 @@ export const getAllProducts = catchAsync(async (req, res, next) => {
     products.map(async (product) => {
       const totalAvailable = await InventoryBatch.getTotalAvailableQuantity(product._id);
 
-      // Get oldest batch for FIFO pricing
-      const oldestBatch = await InventoryBatch.findOne({
-        productId: product._id,
-        status: "active",
-        remainingQuantity: { $gt: 0 }
-      }).sort({ purchaseDate: 1 });
+      // Get oldest batch for FIFO pricing (skipped when nothing is in stock)
+      const oldestBatch =
+        totalAvailable > 0
+          ? await InventoryBatch.findOne({
+              productId: product._id,
+              status: "active",
+              remainingQuantity: { $gt: 0 },
+            })
+              .sort({ purchaseDate: 1 })
+              .select("buyPrice sellPrice")
+              .lean()
+          : null;
 
       return {
         ...product,
@@ -204,12 +216,18 @@ export const getProduct = catchAsync(async (req, res, next) => {
   // Update quantity and prices from batches for accurate stock levels and FIFO pricing
   const totalAvailable = await InventoryBatch.getTotalAvailableQuantity(product._id);
 
-  // Get oldest batch for FIFO pricing
-  const oldestBatch = await InventoryBatch.findOne({
-    productId: product._id,
-    status: "active",
-    remainingQuantity: { $gt: 0 }
-  }).sort({ purchaseDate: 1 });
+  // Get oldest batch for FIFO pricing (skipped when nothing is in stock)
+  const oldestBatch =
+    totalAvailable > 0
+      ? await InventoryBatch.findOne({
+          productId: product._id,
+          status: "active",
+          remainingQuantity: { $gt: 0 },
+        })
+          .sort({ purchaseDate: 1 })
+          .select("buyPrice sellPrice")
+          .lean()
+      : null;
 
   const productWithAccurateStock = {
     ...product.toObject(),
@@ -250,12 +268,18 @@ export const getProductByBarcode = catchAsync(async (req, res, next) => {
   // Update quantity and prices from batches for accurate stock levels and FIFO pricing
   const totalAvailable = await InventoryBatch.getTotalAvailableQuantity(product._id);
 
-  // Get oldest batch for FIFO pricing
-  const oldestBatch = await InventoryBatch.findOne({
-    productId: product._id,
-    status: "active",
-    remainingQuantity: { $gt: 0 }
-  }).sort({ purchaseDate: 1 });
+  // Get oldest batch for FIFO pricing (skipped when nothing is in stock)
+  const oldestBatch =
+    totalAvailable > 0
+      ? await InventoryBatch.findOne({
+          productId: product._id,
+          status: "active",
+          remainingQuantity: { $gt: 0 },
+        })
+          .sort({ purchaseDate: 1 })
+          .select("buyPrice sellPrice")
+          .lean()
+      : null;
 
   const productWithAccurateStock = {
     ...product.toObject(),
@@ -420,9 +444,11 @@ export const createProduct = catchAsync(async (req, res, next) => {
 
 // Update product function - FIXED VERSION
 export const updateProduct = catchAsync(async (req, res, next) => {
-  console.log("=== UPDATE PRODUCT START ===");
-  console.log("Product ID:", req.params.id);
-  console.log("Raw Request Body:", JSON.stringify(req.body, null, 2));
+  if (config.isDevelopment) {
+    console.log("=== UPDATE PRODUCT START ===");
+    console.log("Product ID:", req.params.id);
+    console.log("Raw Request Body:", JSON.stringify(req.body, null, 2));
+  }
 
   const session = await mongoose.startSession();
   session.startTransaction();
@@ -862,12 +888,18 @@ export const searchProducts = catchAsync(async (req, res, next) => {
     products.map(async (product) => {
       const totalAvailable = await InventoryBatch.getTotalAvailableQuantity(product._id);
 
-      // Get oldest batch for FIFO pricing
-      const oldestBatch = await InventoryBatch.findOne({
-        productId: product._id,
-        status: "active",
-        remainingQuantity: { $gt: 0 }
-      }).sort({ purchaseDate: 1 });
+      // Get oldest batch for FIFO pricing (skipped when nothing is in stock)
+      const oldestBatch =
+        totalAvailable > 0
+          ? await InventoryBatch.findOne({
+              productId: product._id,
+              status: "active",
+              remainingQuantity: { $gt: 0 },
+            })
+              .sort({ purchaseDate: 1 })
+              .select("buyPrice sellPrice")
+              .lean()
+          : null;
 
       return {
         ...product,
@@ -30,8 +30,8 @@ export const getAllSales = catchAsync(async (req, res, next) => {
   }
 
   // Calculate pagination
-  const skip = (page - 1) * limit;
   const limitNum = Math.min(limit, config.maxPageSize);
+  const skip = (page - 1) * limitNum;
 
   // Execute query
   const sales = await Sale.find(filter)
@@ -168,54 +168,39 @@ export const createSale = catchAsync(async (req, res, next) => {
     let totalProfit = 0;
     const processedProducts = [];
     const batchUpdates = []; // Collect batch updates for bulk operation
+    const batchHeads = new Map(); // Index of each product's oldest non-depleted batch
 
     // Process all products
     for (const item of products) {
       const product = productMap.get(item.productId);
       const availableBatches = batchesByProduct.get(item.productId) || [];
 
-      // Calculate total available quantity
-      const totalAvailable = availableBatches.reduce(
-        (sum, batch) => sum + batch.remainingQuantity,
-        0
-      );
-
-      // Check if we have enough inventory
-      if (totalAvailable < item.quantity) {
-        throw new AppError(
-          `Insufficient stock for ${product.name}. Available: ${totalAvailable}, Requested: ${item.quantity}`,
-          400
-        );
-      }
-
       // FIFO allocation
       const batchAllocations = [];
       let remainingToAllocate = item.quantity;
       let itemCost = 0;
       let itemPrice = 0;
 
-      for (const batch of availableBatches) {
-        if (remainingToAllocate <= 0) break;
+      // Resume from the product's head so batches drained by an earlier
+      // line of this request are not walked (or allocated from) again
+      let head = batchHeads.get(item.productId) || 0;
 
+      while (remainingToAllocate > 0 && head < availableBatches.length) {
+        const batch = availableBatches[head];
         const allocateFromBatch = Math.min(
           remainingToAllocate,
           batch.remainingQuantity
         );
 
         // Calculate costs for this allocation
-        const allocationCost = batch.buyPrice * allocateFromBatch;
-        const allocationPrice = batch.sellPrice * allocateFromBatch;
-        const allocationProfit = allocationPrice - allocationCost;
+        const { buyPrice, sellPrice } = batch;
+        const allocationCost = buyPrice * allocateFromBatch;
+        const allocationPrice = sellPrice * allocateFromBatch;
 
         // Record the allocation
-        batchAllocations.push({
-          batchId: batch._id,
-          batchNumber: batch.batchNumber,
-          quantity: allocateFromBatch,
-          buyPrice: batch.buyPrice,
-          sellPrice: batch.sellPrice,
-          profit: allocationProfit,
-        });
+        batchAllocations.push(
+          InventoryBatch.buildAllocation(batch, allocateFromBatch)
+        );
 
         // Update batch remaining quantity in memory
         batch.remainingQuantity -= allocateFromBatch;
@@ -235,13 +220,18 @@ export const createSale = catchAsync(async (req, res, next) => {
         itemCost += allocationCost;
         itemPrice += allocationPrice;
         remainingToAllocate -= allocateFromBatch;
+        if (batch.remainingQuantity === 0) head++;
       }
 
-      // Verify all quantity was allocated
+      batchHeads.set(item.productId, head);
+
+      // Stock is only checked once the queue runs out, so a sale covered by the
+      // oldest batch never has to scan the rest of the product's batches
       if (remainingToAllocate > 0) {
+        const totalAvailable = item.quantity - remainingToAllocate;
         throw new AppError(
-          `Failed to allocate full quantity for ${product.name}`,
-          500
+          `Insufficient stock for ${product.name}. Available: ${totalAvailable}, Requested: ${item.quantity}`,
+          400
         );
       }
 
@@ -268,6 +258,9 @@ export const createSale = catchAsync(async (req, res, next) => {
       await InventoryBatch.bulkWrite(batchUpdates, { session });
     }
 
+    // Resync sold products from their batches inside the transaction
+    await Product.syncFromActiveBatches(productIds, session);
+
     // Calculate final amounts with tax and discount
     const taxAmount = (subtotal - discountAmount) * (taxRate / 100);
     const totalAmount = subtotal - discountAmount + taxAmount;
@@ -303,11 +296,6 @@ export const createSale = catchAsync(async (req, res, next) => {
     await sale.save({ session });
     await session.commitTransaction();
 
-    // Update product quantities after batch allocations (outside transaction for speed)
-    for (const productId of productIds) {
-      await Product.updateQuantityFromBatches(productId);
-    }
-
     res.status(201).json({
       status: "success",
       data: {
@@ -357,7 +345,7 @@ export const getRecentSales = catchAsync(async (req, res, next) => {
 
   const sales = await Sale.find()
     .sort("-createdAt")
-    .limit(parseInt(limit))
+    .limit(Math.min(Math.max(parseInt(limit) || 10, 1), config.maxPageSize))
     .lean();
 
   res.status(200).json({
@@ -467,6 +455,14 @@ export const getSalesStats = catchAsync(async (req, res, next) => {
   });
 });
 
+// $dateToString formats for each supported groupBy value
+const SALES_GROUP_FORMATS = new Map([
+  ["hour", "%Y-%m-%d %H:00"],
+  ["day", "%Y-%m-%d"],
+  ["month", "%Y-%m"],
+  ["year", "%Y"],
+]);
+
 // Get sales by date range with FIFO profit analysis
 export const getSalesByDateRange = catchAsync(async (req, res, next) => {
   const { startDate, endDate, groupBy = "day" } = req.query;
@@ -476,29 +472,12 @@ export const getSalesByDateRange = catchAsync(async (req, res, next) => {
     : new Date(Date.now() - 30 * 24 * 60 * 60 * 1000);
   const end = endDate ? new Date(endDate) : new Date();
 
-  let groupFormat;
-  switch (groupBy) {
-    case "hour":
-      groupFormat = {
-        $dateToString: { format: "%Y-%m-%d %H:00", date: "$createdAt" },
-      };
-      break;
-    case "day":
-      groupFormat = {
-        $dateToString: { format: "%Y-%m-%d", date: "$createdAt" },
-      };
-      break;
-    case "month":
-      groupFormat = { $dateToString: { format: "%Y-%m", date: "$createdAt" } };
-      break;
-    case "year":
-      groupFormat = { $dateToString: { format: "%Y", date: "$createdAt" } };
-      break;
-    default:
-      groupFormat = {
-        $dateToString: { format: "%Y-%m-%d", date: "$createdAt" },
-      };
-  }
+  const groupFormat = {
+    $dateToString: {
+      format: SALES_GROUP_FORMATS.get(groupBy) ?? SALES_GROUP_FORMATS.get("day"),
+      date: "$createdAt",
+    },
+  };
 
   const salesData = await Sale.aggregate([
     {
@@ -578,7 +557,7 @@ export const getTopSellingProducts = catchAsync(async (req, res, next) => {
       },
     },
     { $sort: { totalQuantitySold: -1 } },
-    { $limit: parseInt(limit) },
+    { $limit: Math.min(Math.max(parseInt(limit) || 10, 1), config.maxPageSize) },
   ]);
 
   res.status(200).json({
@@ -666,11 +645,36 @@ export const processSaleRefund = catchAsync(async (req, res, next) => {
       throw new AppError("Can only refund completed sales", 400);
     }
 
+    // Key sale lines by product ID once instead of stringifying ObjectIds per
+    // lookup. Only the first line per product is kept, matching find()
+    const saleProductsById = new Map();
+    for (const saleProduct of sale.products) {
+      const productId = saleProduct.productId.toString();
+      if (!saleProductsById.has(productId)) {
+        saleProductsById.set(productId, saleProduct);
+      }
+    }
+
+    // Load every batch the sale drew from in one query; restores are applied
+    // in memory and written back with a single bulkWrite
+    const allocatedBatchIds = sale.products.flatMap((p) =>
+      p.batchAllocations.map((allocation) => allocation.batchId)
+    );
+    const allocatedBatches = await InventoryBatch.find({
+      _id: { $in: allocatedBatchIds },
+    })
+      .select("remainingQuantity status expiryDate")
+      .session(session)
+      .lean();
+    const batchesById = new Map(
+      allocatedBatches.map((batch) => [batch._id.toString(), batch])
+    );
+    const restoredBatches = new Set();
+    const now = new Date();
+
     // Process refund for each item
     for (const refundItem of refundItems) {
-      const saleProduct = sale.products.find(
-        (p) => p.productId.toString() === refundItem.productId
-      );
+      const saleProduct = saleProductsById.get(String(refundItem.productId));
 
       if (!saleProduct) {
         throw new AppError(
@@ -696,9 +700,7 @@ export const processSaleRefund = catchAsync(async (req, res, next) => {
         i--
       ) {
         const allocation = saleProduct.batchAllocations[i];
-        const batch = await InventoryBatch.findById(allocation.batchId).session(
-          session
-        );
+        const batch = batchesById.get(allocation.batchId.toString());
 
         if (batch) {
           const restoreQuantity = Math.min(
@@ -711,20 +713,42 @@ export const processSaleRefund = catchAsync(async (req, res, next) => {
             batch.status = "active";
           }
 
-          await batch.save({ session });
+          // bulkWrite skips the pre-save hook, so apply its expiry check here
+          if (
+            batch.expiryDate &&
+            batch.expiryDate < now &&
+            batch.status === "active"
+          ) {
+            batch.status = "expired";
+          }
+
+          restoredBatches.add(batch);
           remainingToRestore -= restoreQuantity;
         }
       }
+    }
 
-      // Update product quantity
-      const product = await Product.findById(refundItem.productId).session(
-        session
+    if (restoredBatches.size > 0) {
+      await InventoryBatch.bulkWrite(
+        [...restoredBatches].map((batch) => ({
+          updateOne: {
+            filter: { _id: batch._id },
+            update: {
+              remainingQuantity: batch.remainingQuantity,
+              status: batch.status,
+            },
+          },
+        })),
+        { session }
       );
-      if (product) {
-        await product.updateFromBatches();
-      }
     }
 
+    // Resync refunded products from their batches inside the transaction
+    await Product.syncFromActiveBatches(
+      refundItems.map((item) => item.productId),
+      session
+    );
+
     // Update sale status
     sale.status = "refunded";
     sale.refundReason = refundReason;
@@ -733,12 +757,6 @@ export const processSaleRefund = catchAsync(async (req, res, next) => {
 
     await session.commitTransaction();
 
-    // Update product quantities after refund batch updates
-    const uniqueProductIds = [...new Set(refundItems.map(item => item.productId))];
-    for (const productId of uniqueProductIds) {
-      await Product.updateQuantityFromBatches(productId);
-    }
-
     res.status(200).json({
       status: "success",
       message: "Refund processed successfully",
@@ -353,3 +353,66 @@ export const validateInventoryBatch = [
 
   handleValidationErrors,
 ];
+
+// Bulk inventory batch validation
+export const validateInventoryBatchBulk = [
+  body("batches")
+    .isArray({ min: 1, max: 100 })
+    .withMessage("Batches must be an array of 1 to 100 items"),
+
+  body("batches.*.productId")
+    .isMongoId()
+    .withMessage("Product ID must be a valid MongoDB ObjectId"),
+
+  body("batches.*.buyPrice")
+    .isFloat({ gt: 0 })
+    .withMessage("Buy price must be greater than 0"),
+
+  body("batches.*.sellPrice")
+    .isFloat({ gt: 0 })
+    .withMessage("Sell price must be greater than 0"),
+
+  body("batches.*.quantity")
+    .isInt({ min: 1 })
+    .withMessage("Quantity must be a positive integer"),
+
+  body("batches.*.purchaseDate")
+    .optional()
+    .isISO8601()
+    .withMessage("Purchase date must be a valid ISO 8601 date")
+    .custom((value) => {
+      if (new Date(value) > new Date()) {
+        throw new Error("Purchase date cannot be in the future");
+      }
+      return true;
+    }),
+
+  body("batches.*.expiryDate")
+    .optional()
+    .isISO8601()
+    .withMessage("Expiry date must be a valid ISO 8601 date"),
+
+  body("batches.*").custom((batch) => {
+    if (batch.expiryDate) {
+      const purchaseDate = batch.purchaseDate || new Date();
+      if (new Date(batch.expiryDate) <= new Date(purchaseDate)) {
+        throw new Error("Expiry date must be after purchase date");
+      }
+    }
+    return true;
+  }),
+
+  body("batches.*.supplierName")
+    .optional()
+    .trim()
+    .isLength({ max: 100 })
+    .withMessage("Supplier name cannot exceed 100 characters"),
+
+  body("batches.*.notes")
+    .optional()
+    .trim()
+    .isLength({ max: 500 })
+    .withMessage("Notes cannot exceed 500 characters"),
+
+  handleValidationErrors,
+];
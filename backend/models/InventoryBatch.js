@@ -118,21 +118,27 @@ inventoryBatchSchema.index({ productId: 1, purchaseDate: 1 });
 inventoryBatchSchema.index({ productId: 1, status: 1, remainingQuantity: 1 });
 inventoryBatchSchema.index({ status: 1 });
 
+// Build a batch number from a timestamp plus a random suffix
+inventoryBatchSchema.statics.generateBatchNumber = function (date = new Date()) {
+  const year = date.getFullYear();
+  const month = String(date.getMonth() + 1).padStart(2, "0");
+  const day = String(date.getDate()).padStart(2, "0");
+  const hours = String(date.getHours()).padStart(2, "0");
+  const minutes = String(date.getMinutes()).padStart(2, "0");
+  const seconds = String(date.getSeconds()).padStart(2, "0");
+  const milliseconds = String(date.getMilliseconds()).padStart(3, "0");
+  const random = Math.random().toString(36).substring(2, 8).toUpperCase();
+
+  // More unique batch number with timestamp and random string
+  return `BATCH-${year}${month}${day}-${hours}${minutes}${seconds}${milliseconds}-${random}`;
+};
+
 // Generate batch number before saving - IMPROVED VERSION
 inventoryBatchSchema.pre("save", async function (next) {
+  const now = new Date();
+
   if (!this.batchNumber) {
-    const date = new Date();
-    const year = date.getFullYear();
-    const month = String(date.getMonth() + 1).padStart(2, "0");
-    const day = String(date.getDate()).padStart(2, "0");
-    const hours = String(date.getHours()).padStart(2, "0");
-    const minutes = String(date.getMinutes()).padStart(2, "0");
-    const seconds = String(date.getSeconds()).padStart(2, "0");
-    const milliseconds = String(date.getMilliseconds()).padStart(3, "0");
-    const random = Math.random().toString(36).substring(2, 8).toUpperCase();
-
-    // More unique batch number with timestamp and random string
-    this.batchNumber = `BATCH-${year}${month}${day}-${hours}${minutes}${seconds}${milliseconds}-${random}`;
+    this.batchNumber = this.constructor.generateBatchNumber(now);
   }
 
   // Auto-update status based on quantity
@@ -143,7 +149,7 @@ inventoryBatchSchema.pre("save", async function (next) {
   // Check if batch is expired
   if (
     this.expiryDate &&
-    this.expiryDate < new Date() &&
+    this.expiryDate < now &&
     this.status === "active"
   ) {
     this.status = "expired";
@@ -169,6 +175,21 @@ inventoryBatchSchema.methods.consume = function (quantity) {
   return this.save();
 };
 
+// Build the allocation record stored on sales and loans for units taken from a batch.
+// Every allocation is created here so they all share one fixed shape.
+inventoryBatchSchema.statics.buildAllocation = function (batch, quantity) {
+  const { buyPrice, sellPrice } = batch;
+
+  return {
+    batchId: batch._id,
+    batchNumber: batch.batchNumber,
+    quantity,
+    buyPrice,
+    sellPrice,
+    profit: sellPrice * quantity - buyPrice * quantity,
+  };
+};
+
 // Add this static method to get total available quantity
 inventoryBatchSchema.statics.getTotalAvailableQuantity = async function (
   productId
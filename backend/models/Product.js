@@ -204,6 +204,90 @@ productSchema.statics.updateQuantityFromBatches = async function (productId) {
     });
   }
 };
+
+// Recompute stock and weighted prices for several products from their active
+// batches with one aggregation and one bulkWrite. Runs inside the caller's
+// session so it sees that transaction's batch updates
+productSchema.statics.syncFromActiveBatches = async function (
+  productIds,
+  session
+) {
+  const InventoryBatch = mongoose.model("InventoryBatch");
+  const ids = [...new Set(productIds.map((id) => id.toString()))].map(
+    (id) => new mongoose.Types.ObjectId(id)
+  );
+
+  if (ids.length === 0) return;
+
+  const aggregation = await InventoryBatch.aggregate([
+    {
+      $match: {
+        productId: { $in: ids },
+        status: "active",
+        remainingQuantity: { $gt: 0 },
+      },
+    },
+    {
+      $group: {
+        _id: "$productId",
+        totalQuantity: { $sum: "$remainingQuantity" },
+        weightedBuyPrice: {
+          $sum: {
+            $multiply: ["$buyPrice", "$remainingQuantity"],
+          },
+        },
+        weightedSellPrice: {
+          $sum: {
+            $multiply: ["$sellPrice", "$remainingQuantity"],
+          },
+        },
+      },
+    },
+  ]).session(session);
+
+  const statsByProduct = new Map(
+    aggregation.map((stats) => [stats._id.toString(), stats])
+  );
+
+  await this.bulkWrite(
+    ids.map((id) => {
+      const stats = statsByProduct.get(id.toString());
+      if (!stats) {
+        return {
+          updateOne: {
+            filter: { _id: id },
+            update: {
+              quantity: 0,
+              totalQuantity: 0,
+              currentBuyPrice: 0,
+              currentSellPrice: 0,
+            },
+          },
+        };
+      }
+
+      // Same rounding and legacy price sync as updateFromBatches
+      const currentBuyPrice = Number(
+        (stats.weightedBuyPrice / stats.totalQuantity).toFixed(2)
+      );
+      const currentSellPrice = Number(
+        (stats.weightedSellPrice / stats.totalQuantity).toFixed(2)
+      );
+      const update = {
+        quantity: stats.totalQuantity,
+        totalQuantity: stats.totalQuantity,
+        currentBuyPrice,
+        currentSellPrice,
+      };
+      if (currentBuyPrice) update.buyPrice = currentBuyPrice;
+      if (currentSellPrice) update.sellPrice = currentSellPrice;
+
+      return { updateOne: { filter: { _id: id }, update } };
+    }),
+    { session }
+  );
+};
+
 // Static method to get products with batch details
 productSchema.statics.getWithBatchDetails = function () {
   return this.aggregate([
@@ -1,6 +1,7 @@
 import express from "express";
 import {
   addInventoryBatch,
+  addInventoryBatchesBulk,
   getProductBatches,
   getInventoryValuation,
   getExpiringBatches,
@@ -11,6 +12,7 @@ import {
   validateObjectId,
   validateQuery,
   validateInventoryBatch,
+  validateInventoryBatchBulk,
 } from "../middleware/validation.js";
 
 const router = express.Router();
@@ -21,6 +23,7 @@ router.get("/expiring", getExpiringBatches);
 
 // Batch management routes
 router.post("/batches", validateInventoryBatch, addInventoryBatch);
+router.post("/batches/bulk", validateInventoryBatchBulk, addInventoryBatchesBulk);
 
 // Product-specific batch routes
 router.get("/products/:productId/batches", validateObjectId, getProductBatches);
@@ -214,8 +214,10 @@ const sampleProducts = [
 ];
 
 // Function to create inventory batches for products
-const createInventoryBatches = async (products) => {
+const createInventoryBatches = (products) => {
   const batches = [];
+  // One timestamp for the whole run; batch numbers stay unique via indices
+  const seededAt = Date.now();
 
   for (let idx = 0; idx < products.length; idx++) {
     const product = products[idx];
@@ -236,19 +238,16 @@ const createInventoryBatches = async (products) => {
     for (let i = 0; i < numBatches; i++) {
       const batchQuantity =
         i === 0 ? quantityPerBatch + remainder : quantityPerBatch;
-      const purchaseDate = new Date();
+      const purchaseDate = new Date(seededAt);
       purchaseDate.setDate(purchaseDate.getDate() - 30 * (numBatches - i)); // Stagger purchase dates
 
       const buyPrice = originalProduct.buyPrice * (0.9 + Math.random() * 0.2); // Vary buy price ±10%
       const sellPrice = originalProduct.sellPrice; // Use product's sellPrice
       
-      // Add timestamp and index to ensure unique batch numbers
-      const timestamp = Date.now() + i;
-      await new Promise(resolve => setTimeout(resolve, 10)); // Small delay to ensure unique timestamps
-      
       batches.push({
         productId: product._id,
-        batchNumber: `BATCH-${timestamp}-${Math.random().toString(36).substr(2, 9)}`,
+        // Product and batch indices keep numbers unique without waiting on the clock
+        batchNumber: `BATCH-${seededAt}-${idx}-${i}`,
         buyPrice: Math.round(buyPrice * 100) / 100, // Round to 2 decimal places
         sellPrice: Math.round(sellPrice * 100) / 100,
         initialQuantity: batchQuantity,
@@ -357,18 +356,13 @@ const seedDatabase = async () => {
 
     // Create and insert inventory batches
     console.log("📦 Creating inventory batches...");
-    const batches = await createInventoryBatches(products);
+    const batches = createInventoryBatches(products);
     const insertedBatches = await InventoryBatch.insertMany(batches);
     console.log(`✅ Created ${insertedBatches.length} inventory batches`);
 
     // Update product quantities from batches
     console.log("🔄 Updating product quantities from batches...");
-    for (const product of products) {
-      const productDoc = await Product.findById(product._id);
-      if (productDoc) {
-        await productDoc.updateFromBatches();
-      }
-    }
+    await Promise.all(products.map((product) => product.updateFromBatches()));
     console.log("✅ Product quantities updated");
 
     // Skip sales creation - sales require FIFO allocation through the API
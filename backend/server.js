@@ -111,14 +111,16 @@ app.use(
   })
 );
 
-// Request logging middleware
-app.use((req, res, next) => {
-  console.log(`${new Date().toISOString()} - ${req.method} ${req.path}`);
-  if (req.body && Object.keys(req.body).length > 0) {
-    console.log("Request body keys:", Object.keys(req.body));
-  }
-  next();
-});
+// Request logging middleware in development
+if (config.isDevelopment) {
+  app.use((req, res, next) => {
+    console.log(`${new Date().toISOString()} - ${req.method} ${req.path}`);
+    if (req.body && Object.keys(req.body).length > 0) {
+      console.log("Request body keys:", Object.keys(req.body));
+    }
+    next();
+  });
+}
 
 // Health check endpoint
 app.get("/health", (req, res) => {
@@ -188,6 +190,8 @@ app.get(`${config.apiPrefix}/docs`, (req, res) => {
             "Get inventory summary with FIFO costs",
           "GET /api/v1/inventory/batches": "Get all inventory batches",
           "POST /api/v1/inventory/batches": "Add new inventory batch",
+          "POST /api/v1/inventory/batches/bulk":
+            "Add up to 100 inventory batches in one transaction",
           "GET /api/v1/inventory/products/:id/batches":
             "Get batches for product",
           "PUT /api/v1/inventory/batches/:id": "Update inventory batch",
@@ -12,6 +12,7 @@ import {
 } from "recharts";
 import { Package, AlertCircle } from "lucide-react";
 import { Alert, AlertDescription } from "@/components/ui/alert";
+import { formatCurrency } from "@/lib/utils";
 
 const COLORS = [
   "#3b82f6", // Blue
@@ -132,7 +133,7 @@ const CategoryChart = () => {
             {t("items")}: {data.count}
           </p>
           <p className="text-sm text-green-600">
-            {t("value")}: ${data.value?.toLocaleString() || 0}
+            {t("value")}: {formatCurrency(data.value || 0)}
           </p>
         </div>
       );
@@ -224,7 +225,7 @@ const CategoryChart = () => {
               </div>
               <div className="text-center p-2 bg-green-50 rounded">
                 <p className="font-semibold text-green-900">
-                  ${totalValue.toLocaleString()}
+                  {formatCurrency(totalValue)}
                 </p>
                 <p className="text-green-600">Total Value</p>
               </div>
@@ -288,7 +289,7 @@ const CategoryChart = () => {
                     </span>
                     <br />
                     <span className="text-xs text-green-600">
-                      ${category.value.toLocaleString()}
+                      {formatCurrency(category.value)}
                     </span>
                   </div>
                 </div>
@@ -3,7 +3,8 @@ import { useStore } from "@/contexts/StoreContext";
 import { useLanguage } from "@/contexts/LanguageContext";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
-import { Clock, DollarSign, ShoppingCart } from "lucide-react";
+import { Clock, ShoppingCart } from "lucide-react";
+import { formatCurrency } from "@/lib/utils";
 
 const RecentSales = () => {
   const { sales, loading, error } = useStore();
@@ -101,9 +102,8 @@ const RecentSales = () => {
                     {t("cashier")}: {sale.cashierName || t("unknown")}
                   </div>
                 </div>
-                <div className="flex items-center gap-1 font-semibold text-green-600">
-                  <DollarSign className="w-4 h-4" />
-                  {(sale.totalAmount || 0).toFixed(2)}
+                <div className="font-semibold text-green-600">
+                  {formatCurrency(sale.totalAmount || 0)}
                 </div>
               </div>
             ))
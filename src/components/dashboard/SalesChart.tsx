@@ -15,6 +15,7 @@ import {
 } from "recharts";
 import { TrendingUp, AlertCircle } from "lucide-react";
 import { Alert, AlertDescription } from "@/components/ui/alert";
+import { formatCurrency } from "@/lib/utils";
 
 // Custom tooltip component for better formatting
 const CustomTooltip = ({ active, payload, label, t }: any) => {
@@ -26,7 +27,7 @@ const CustomTooltip = ({ active, payload, label, t }: any) => {
           <p key={index} style={{ color: entry.color }} className="text-sm">
             {`${
               entry.name === "sales" ? t("sales_label") : t("profit_label")
-            }: $${entry.value?.toLocaleString() || "0"}`}
+            }: ${formatCurrency(entry.value || 0)}`}
           </p>
         ))}
       </div>
@@ -170,13 +171,13 @@ const SalesChart = () => {
           <div className="text-sm">
             <span className="text-gray-500">{t("total_sales")}: </span>
             <span className="font-semibold text-blue-600">
-              ${totalSales.toLocaleString()}
+              {formatCurrency(totalSales)}
             </span>
           </div>
           <div className="text-sm">
             <span className="text-gray-500">{t("total_profit_display")}: </span>
             <span className="font-semibold text-green-600">
-              ${totalProfit.toLocaleString()}
+              {formatCurrency(totalProfit)}
             </span>
           </div>
         </div>
@@ -10,6 +10,7 @@ import {
   ArrowUpRight,
   ArrowDownRight,
 } from "lucide-react";
+import { formatCurrency } from "@/lib/utils";
 
 const StatsCards = () => {
   const { products, getTodaysSales, getMonthlyStats, loading, error } =
@@ -33,7 +34,7 @@ const StatsCards = () => {
   const stats = [
     {
       title: t("total_sales_today"),
-      value: `$${todaysSales.toLocaleString()}`,
+      value: formatCurrency(todaysSales),
       change: t("change_positive"),
       changeType: "positive" as const,
       icon: DollarSign,
@@ -41,7 +42,7 @@ const StatsCards = () => {
     },
     {
       title: t("monthly_sales"),
-      value: `$${monthlyStats.sales.toLocaleString()}`,
+      value: formatCurrency(monthlyStats.sales),
       change: t("change_monthly_sales"),
       changeType: "positive" as const,
       icon: ShoppingCart,
@@ -49,7 +50,7 @@ const StatsCards = () => {
     },
     {
       title: t("total_profit"),
-      value: `$${monthlyStats.profit.toLocaleString()}`,
+      value: formatCurrency(monthlyStats.profit),
       change: t("change_monthly_profit"),
       changeType: "positive" as const,
       icon: TrendingUp,
@@ -58,7 +59,7 @@ const StatsCards = () => {
     {
       title: t("products_in_stock"),
       value: totalProducts.toString(),
-      change: `$${totalValue.toLocaleString()} ${t("value")}`,
+      change: `${formatCurrency(totalValue)} ${t("value")}`,
       changeType: "neutral" as const,
       icon: Package,
       color: "bg-orange-500",
@@ -29,6 +29,7 @@ import {
   AlertCircle,
 } from "lucide-react";
 import { Alert, AlertDescription } from "@/components/ui/alert";
+import { formatCurrency } from "@/lib/utils";
 
 interface AddInventoryDialogProps {
   isOpen: boolean;
@@ -166,8 +167,8 @@ const AddInventoryDialog: React.FC<AddInventoryDialogProps> = ({
       const totalCostPerUnit = calculateTotalCostPerUnit();
       if (Number(data.sellPrice) < totalCostPerUnit) {
         throw new Error(
-          `Sell price must be at least ${totalCostPerUnit.toFixed(
-            2
+          `Sell price must be at least ${formatCurrency(
+            totalCostPerUnit
           )} (total cost per unit)`
         );
       }
@@ -343,18 +344,18 @@ const AddInventoryDialog: React.FC<AddInventoryDialogProps> = ({
                     units
                   </p>
                   <p>
-                    <strong>Current Sell Price:</strong> $
-                    {(
+                    <strong>Current Sell Price:</strong>{" "}
+                    {formatCurrency(
                       selectedProduct.currentSellPrice ||
-                      selectedProduct.sellPrice
-                    ).toFixed(2)}
+                        selectedProduct.sellPrice
+                    )}
                   </p>
                   <p>
-                    <strong>Current Buy Price:</strong> $
-                    {(
+                    <strong>Current Buy Price:</strong>{" "}
+                    {formatCurrency(
                       selectedProduct.currentBuyPrice ||
-                      selectedProduct.buyPrice
-                    ).toFixed(2)}
+                        selectedProduct.buyPrice
+                    )}
                   </p>
                 </div>
               </div>
@@ -491,8 +492,8 @@ const AddInventoryDialog: React.FC<AddInventoryDialogProps> = ({
                     const totalCost = calculateTotalCostPerUnit();
                     return (
                       Number(value) >= totalCost ||
-                      `Sell price must be at least ${totalCost.toFixed(
-                        2
+                      `Sell price must be at least ${formatCurrency(
+                        totalCost
                       )} (total cost per unit)`
                     );
                   },
@@ -626,7 +627,7 @@ const AddInventoryDialog: React.FC<AddInventoryDialogProps> = ({
                 <div>
                   <span className="text-gray-600">Total Cost per Unit:</span>
                   <span className="ml-2 font-semibold">
-                    ${calculateTotalCostPerUnit().toFixed(2)}
+                    {formatCurrency(calculateTotalCostPerUnit())}
                   </span>
                 </div>
                 <div>
@@ -638,17 +639,16 @@ const AddInventoryDialog: React.FC<AddInventoryDialogProps> = ({
                         : "text-red-600"
                     }`}
                   >
-                    ${calculateProfitPerUnit().toFixed(2)}
+                    {formatCurrency(calculateProfitPerUnit())}
                   </span>
                 </div>
                 <div>
                   <span className="text-gray-600">Total Investment:</span>
                   <span className="ml-2 font-semibold">
-                    $
-                    {(
+                    {formatCurrency(
                       calculateTotalCostPerUnit() *
-                      (Number(form.watch("quantity")) || 0)
-                    ).toFixed(2)}
+                        (Number(form.watch("quantity")) || 0)
+                    )}
                   </span>
                 </div>
                 <div>
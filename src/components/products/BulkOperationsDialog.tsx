@@ -14,6 +14,7 @@ import { Checkbox } from "@/components/ui/checkbox";
 import { Card, CardContent } from "@/components/ui/card";
 import { useToast } from "@/hooks/use-toast";
 import { Trash2, Edit, Package } from "lucide-react";
+import { formatCurrency } from "@/lib/utils";
 
 interface BulkOperationsDialogProps {
   isOpen: boolean;
@@ -287,7 +288,7 @@ const BulkOperationsDialog: React.FC<BulkOperationsDialogProps> = ({
                 {selectedProductDetails.length > 0 ? (
                   selectedProductDetails.map((product) => (
                     <div key={product.id} className="text-sm text-gray-600">
-                      {product.name} - {product.category} (${product.sellPrice})
+                      {product.name} - {product.category} ({formatCurrency(product.sellPrice)})
                     </div>
                   ))
                 ) : (
@@ -19,6 +19,7 @@ import { Input } from "@/components/ui/input";
 import { Button } from "@/components/ui/button";
 import { useToast } from "@/hooks/use-toast";
 import { Textarea } from "@/components/ui/textarea";
+import { formatCurrency } from "@/lib/utils";
 
 interface EditProductDialogProps {
   product: Product;
@@ -487,14 +488,16 @@ const EditProductDialog: React.FC<EditProductDialogProps> = ({
                   )}
                   {form.formState.dirtyFields.buyPrice && (
                     <div className="text-blue-800">
-                      <strong>Buy Price:</strong> ${product.buyPrice} → $
-                      {form.getValues("buyPrice")}
+                      <strong>Buy Price:</strong>{" "}
+                      {formatCurrency(product.buyPrice)} →{" "}
+                      {formatCurrency(Number(form.getValues("buyPrice")))}
                     </div>
                   )}
                   {form.formState.dirtyFields.sellPrice && (
                     <div className="text-blue-800">
-                      <strong>Sell Price:</strong> ${product.sellPrice} → $
-                      {form.getValues("sellPrice")}
+                      <strong>Sell Price:</strong>{" "}
+                      {formatCurrency(product.sellPrice)} →{" "}
+                      {formatCurrency(Number(form.getValues("sellPrice")))}
                     </div>
                   )}
                   {form.formState.dirtyFields.quantity && (
@@ -4,3 +4,22 @@ import { twMerge } from "tailwind-merge"
 export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs))
 }
+
+const currencyFormatter = new Intl.NumberFormat("en-US", {
+  style: "currency",
+  currency: "USD",
+});
+const currencyCache = new Map<number, string>();
+const CURRENCY_CACHE_LIMIT = 1000;
+
+// Formats a dollar amount as "$1,234.56". Table and card renders hit the
+// same values repeatedly, so results are memoized (bounded) per value.
+export function formatCurrency(value: number): string {
+  let formatted = currencyCache.get(value);
+  if (formatted === undefined) {
+    if (currencyCache.size >= CURRENCY_CACHE_LIMIT) currencyCache.clear();
+    formatted = currencyFormatter.format(value);
+    currencyCache.set(value, formatted);
+  }
+  return formatted;
+}
@@ -30,6 +30,7 @@ import {
 import { useToast } from "@/hooks/use-toast";
 import { Alert, AlertDescription } from "@/components/ui/alert";
 import { format, addDays, differenceInDays } from "date-fns";
+import { formatCurrency } from "@/lib/utils";
 
 interface LoanSale {
   id: string;
@@ -228,7 +229,7 @@ const Loans = () => {
 
       toast({
         title: "Payment Recorded! 💰",
-        description: `Payment of $${amount.toFixed(2)} recorded successfully`,
+        description: `Payment of ${formatCurrency(amount)} recorded successfully`,
       });
     } catch (error) {
       toast({
@@ -307,7 +308,7 @@ const Loans = () => {
               <div>
                 <p className="text-sm font-medium text-gray-600">Outstanding</p>
                 <p className="text-2xl font-bold text-red-600">
-                  ${statistics.totalOutstanding.toFixed(2)}
+                  {formatCurrency(statistics.totalOutstanding)}
                 </p>
               </div>
               <div className="p-3 bg-red-100 rounded-full">
@@ -323,7 +324,7 @@ const Loans = () => {
               <div>
                 <p className="text-sm font-medium text-gray-600">Collected</p>
                 <p className="text-2xl font-bold text-green-600">
-                  ${statistics.totalCollected.toFixed(2)}
+                  {formatCurrency(statistics.totalCollected)}
                 </p>
               </div>
               <div className="p-3 bg-green-100 rounded-full">
@@ -420,11 +421,11 @@ const Loans = () => {
                         </p>
                       </td>
                       <td className="p-3 text-right">
-                        <p className="font-medium">${loan.totalAmount.toFixed(2)}</p>
+                        <p className="font-medium">{formatCurrency(loan.totalAmount)}</p>
                       </td>
                       <td className="p-3 text-right">
                         <p className="font-medium text-red-600">
-                          ${loan.remainingBalance.toFixed(2)}
+                          {formatCurrency(loan.remainingBalance)}
                         </p>
                       </td>
                       <td className="p-3 text-center">
@@ -535,11 +536,11 @@ const Loans = () => {
                   <CardContent className="space-y-3">
                     <div className="flex justify-between">
                       <span className="text-gray-600">Total Amount:</span>
-                      <span className="font-medium">${selectedLoan.totalAmount.toFixed(2)}</span>
+                      <span className="font-medium">{formatCurrency(selectedLoan.totalAmount)}</span>
                     </div>
                     <div className="flex justify-between">
                       <span className="text-gray-600">Down Payment:</span>
-                      <span className="font-medium">${selectedLoan.downPayment.toFixed(2)}</span>
+                      <span className="font-medium">{formatCurrency(selectedLoan.downPayment)}</span>
                     </div>
                     <div className="flex justify-between">
                       <span className="text-gray-600">Interest Rate:</span>
@@ -552,7 +553,7 @@ const Loans = () => {
                     <div className="flex justify-between border-t pt-2">
                       <span className="text-gray-600">Remaining Balance:</span>
                       <span className="font-bold text-red-600">
-                        ${selectedLoan.remainingBalance.toFixed(2)}
+                        {formatCurrency(selectedLoan.remainingBalance)}
                       </span>
                     </div>
                     <div className="flex justify-between">
@@ -577,10 +578,10 @@ const Loans = () => {
                         <div>
                           <p className="font-medium">{product.productName}</p>
                           <p className="text-sm text-gray-600">
-                            Qty: {product.quantity} × ${product.sellPrice.toFixed(2)}
+                            Qty: {product.quantity} × {formatCurrency(product.sellPrice)}
                           </p>
                         </div>
-                        <span className="font-medium">${product.total.toFixed(2)}</span>
+                        <span className="font-medium">{formatCurrency(product.total)}</span>
                       </div>
                     ))}
                   </div>
@@ -597,7 +598,7 @@ const Loans = () => {
                     {selectedLoan.paymentHistory.map((payment) => (
                       <div key={payment.id} className="flex justify-between items-center p-3 border rounded">
                         <div>
-                          <p className="font-medium">${payment.amount.toFixed(2)}</p>
+                          <p className="font-medium">{formatCurrency(payment.amount)}</p>
                           <p className="text-sm text-gray-600">
                             {format(payment.date, "MMM dd, yyyy 'at' HH:mm")} • {payment.paymentMethod}
                           </p>
@@ -640,7 +641,7 @@ const Loans = () => {
             <div className="p-6 border-b">
               <h2 className="text-xl font-bold">Record Payment</h2>
               <p className="text-gray-600">
-                Outstanding: ${selectedLoan.remainingBalance.toFixed(2)}
+                Outstanding: {formatCurrency(selectedLoan.remainingBalance)}
               </p>
             </div>
 
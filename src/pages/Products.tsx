@@ -1,4 +1,4 @@
-import React, { useState } from "react";
+import React, { useMemo, useState } from "react";
 import { useStore } from "@/contexts/StoreContext";
 import { useLanguage } from "@/contexts/LanguageContext";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
@@ -13,7 +13,6 @@ import {
   Trash2,
   Package,
   AlertTriangle,
-  DollarSign,
   Settings,
   Layers,
   TrendingUp,
@@ -23,6 +22,7 @@ import AddProductDialog from "@/components/products/AddProductDialog";
 import EditProductDialog from "@/components/products/EditProductDialog";
 import BulkOperationsDialog from "@/components/products/BulkOperationsDialog";
 import AddInventoryDialog from "@/components/products/AddInventoryDialog";
+import { formatCurrency } from "@/lib/utils";
 
 const Products = () => {
   const { products, deleteProduct, getLowStockProducts } = useStore();
@@ -39,25 +39,33 @@ const Products = () => {
   } | null>(null);
 
   const lowStockProducts = getLowStockProducts();
-  const categories = Array.from(
-    new Set(products.filter((p) => p && p.category).map((p) => p.category))
+  const categories = useMemo(
+    () =>
+      Array.from(
+        new Set(products.filter((p) => p && p.category).map((p) => p.category))
+      ),
+    [products]
   );
 
-  const filteredProducts = products.filter((product) => {
-    // Safety checks for undefined values
-    if (!product || !product.name || !product.category) {
-      return false;
-    }
+  // Re-filter only when the inputs change, not on every selection toggle
+  const filteredProducts = useMemo(() => {
+    const search = searchTerm.toLowerCase();
+
+    return products.filter((product) => {
+      // Safety checks for undefined values
+      if (!product || !product.name || !product.category) {
+        return false;
+      }
 
-    const matchesSearch =
-      product.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      product.category.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      (product.barcode &&
-        product.barcode.toLowerCase().includes(searchTerm.toLowerCase()));
-    const matchesCategory =
-      categoryFilter === "all" || product.category === categoryFilter;
-    return matchesSearch && matchesCategory;
-  });
+      const matchesSearch =
+        product.name.toLowerCase().includes(search) ||
+        product.category.toLowerCase().includes(search) ||
+        (product.barcode && product.barcode.toLowerCase().includes(search));
+      const matchesCategory =
+        categoryFilter === "all" || product.category === categoryFilter;
+      return matchesSearch && matchesCategory;
+    });
+  }, [products, searchTerm, categoryFilter]);
 
   const handleDeleteProduct = (id: string) => {
     if (window.confirm(t("delete_product_confirm"))) {
@@ -324,9 +332,8 @@ const Products = () => {
                           : t("buy_price")}
                       </p>
                       <p className="font-medium">
-                        $
-                        {(product.currentBuyPrice || product.buyPrice).toFixed(
-                          2
+                        {formatCurrency(
+                          product.currentBuyPrice || product.buyPrice
                         )}
                       </p>
                     </div>
@@ -336,11 +343,10 @@ const Products = () => {
                           ? "Avg Sell Price"
                           : t("sell_price")}
                       </p>
-                      <p className="font-bold text-green-600 flex items-center gap-1">
-                        <DollarSign className="w-3 h-3" />
-                        {(
+                      <p className="font-bold text-green-600">
+                        {formatCurrency(
                           product.currentSellPrice || product.sellPrice
-                        ).toFixed(2)}
+                        )}
                       </p>
                     </div>
                   </div>
@@ -349,11 +355,10 @@ const Products = () => {
                       {t("profit_per_unit")}
                     </p>
                     <p className="text-sm font-medium text-blue-600">
-                      $
-                      {(
+                      {formatCurrency(
                         (product.currentSellPrice || product.sellPrice) -
-                        (product.currentBuyPrice || product.buyPrice)
-                      ).toFixed(2)}
+                          (product.currentBuyPrice || product.buyPrice)
+                      )}
                     </p>
                   </div>
                 </div>
@@ -46,6 +46,7 @@ import {
 } from "lucide-react";
 import { format, subDays, startOfMonth, endOfMonth, subMonths } from "date-fns";
 import { Alert, AlertDescription } from "@/components/ui/alert";
+import { formatCurrency } from "@/lib/utils";
 
 const Reports = () => {
   const { products, sales, dashboardData, refreshData } = useStore();
@@ -459,9 +460,24 @@ const Reports = () => {
   ];
 
   // Export functions
+  const downloadCsv = (rows: string[], filename: string) => {
+    // A Blob hands the rows to the browser as-is, without building and
+    // URI-encoding one large data: string
+    const blob = new Blob([rows.join("\n")], {
+      type: "text/csv;charset=utf-8",
+    });
+    const url = URL.createObjectURL(blob);
+    const link = document.createElement("a");
+    link.setAttribute("href", url);
+    link.setAttribute("download", filename);
+    document.body.appendChild(link);
+    link.click();
+    document.body.removeChild(link);
+    URL.revokeObjectURL(url);
+  };
+
   const exportSalesReport = () => {
-    const csvContent =
-      "data:text/csv;charset=utf-8," +
+    downloadCsv(
       [
         "Date,Receipt Number,Customer,Cashier,Total Amount,Payment Method",
         ...filteredSales.map((sale) =>
@@ -474,26 +490,16 @@ const Reports = () => {
             sale.paymentMethod,
           ].join(",")
         ),
-      ].join("\n");
-
-    const encodedUri = encodeURI(csvContent);
-    const link = document.createElement("a");
-    link.setAttribute("href", encodedUri);
-    link.setAttribute(
-      "download",
+      ],
       `sales_report_${format(startDate, "yyyy-MM-dd")}_to_${format(
         endDate,
         "yyyy-MM-dd"
       )}.csv`
     );
-    document.body.appendChild(link);
-    link.click();
-    document.body.removeChild(link);
   };
 
   const exportProductReport = () => {
-    const csvContent =
-      "data:text/csv;charset=utf-8," +
+    downloadCsv(
       [
         "Product Name,Category,Buy Price,Sell Price,Quantity,Low Stock Threshold,Inventory Value",
         ...products.map((product) =>
@@ -507,18 +513,9 @@ const Reports = () => {
             (product.sellPrice * product.quantity).toFixed(2),
           ].join(",")
         ),
-      ].join("\n");
-
-    const encodedUri = encodeURI(csvContent);
-    const link = document.createElement("a");
-    link.setAttribute("href", encodedUri);
-    link.setAttribute(
-      "download",
+      ],
       `inventory_report_${format(new Date(), "yyyy-MM-dd")}.csv`
     );
-    document.body.appendChild(link);
-    link.click();
-    document.body.removeChild(link);
   };
 
   const handleRefresh = async () => {
@@ -574,14 +571,14 @@ const Reports = () => {
         <div className="bg-white p-3 border rounded-lg shadow-lg">
           <p className="font-semibold text-gray-900">{data.category}</p>
           <p className="text-sm text-green-600">
-            Revenue: ${data.revenue?.toLocaleString() || 0}
+            Revenue: {formatCurrency(data.revenue || 0)}
           </p>
           <p className="text-sm text-blue-600">
             Quantity: {data.quantity || 0}
           </p>
           {data.profit && (
             <p className="text-sm text-purple-600">
-              Profit: ${data.profit?.toLocaleString() || 0}
+              Profit: {formatCurrency(data.profit || 0)}
             </p>
           )}
         </div>
@@ -702,7 +699,7 @@ const Reports = () => {
                   {t("total_revenue")}
                 </p>
                 <p className="text-2xl font-bold text-green-600">
-                  ${totalRevenue.toFixed(2)}
+                  {formatCurrency(totalRevenue)}
                 </p>
               </div>
               <div className="p-3 bg-green-100 rounded-full">
@@ -736,7 +733,7 @@ const Reports = () => {
                   {t("total_profit_display")}
                 </p>
                 <p className="text-2xl font-bold text-purple-600">
-                  ${totalProfit.toFixed(2)}
+                  {formatCurrency(totalProfit)}
                 </p>
               </div>
               <div className="p-3 bg-purple-100 rounded-full">
@@ -754,7 +751,7 @@ const Reports = () => {
                   {t("avg_sale_value")}
                 </p>
                 <p className="text-2xl font-bold text-orange-600">
-                  ${averageSaleValue.toFixed(2)}
+                  {formatCurrency(averageSaleValue)}
                 </p>
               </div>
               <div className="p-3 bg-orange-100 rounded-full">
@@ -793,7 +790,7 @@ const Reports = () => {
                     <YAxis />
                     <Tooltip
                       formatter={(value, name) => [
-                        name === "revenue" ? `$${value}` : value,
+                        name === "revenue" ? formatCurrency(Number(value)) : value,
                         name === "revenue" ? t("revenue") : t("sales_count"),
                       ]}
                     />
@@ -880,7 +877,7 @@ const Reports = () => {
                           </div>
                           <div className="text-right">
                             <span className="text-green-600">
-                              ${category.revenue.toLocaleString()}
+                              {formatCurrency(category.revenue)}
                             </span>
                             <br />
                             <span className="text-xs text-gray-500">
@@ -1017,10 +1014,10 @@ const Reports = () => {
                         </div>
                         <div className="text-right">
                           <p className="font-bold text-green-600">
-                            ${product.revenue.toFixed(2)}
+                            {formatCurrency(product.revenue)}
                           </p>
                           <p className="text-sm text-gray-600">
-                            {t("profit")}: ${product.profit.toFixed(2)}
+                            {t("profit")}: {formatCurrency(product.profit)}
                           </p>
                         </div>
                       </div>
@@ -1052,11 +1049,11 @@ const Reports = () => {
                         </div>
                         <div className="flex justify-between text-sm text-gray-600">
                           <span>
-                            {t("revenue")}: $
-                            {(category.revenue || 0).toFixed(2)}
+                            {t("revenue")}:{" "}
+                            {formatCurrency(category.revenue || 0)}
                           </span>
                           <span>
-                            {t("profit")}: ${(category.profit || 0).toFixed(2)}
+                            {t("profit")}: {formatCurrency(category.profit || 0)}
                           </span>
                         </div>
                       </div>
@@ -1156,7 +1153,7 @@ const Reports = () => {
                       </Pie>
                       <Tooltip
                         formatter={(value) => [
-                          `${value}`,
+                          formatCurrency(Number(value)),
                           t("inventory_value"),
                         ]}
                       />
@@ -1213,7 +1210,7 @@ const Reports = () => {
                             {category.quantity}
                           </td>
                           <td className="p-3 text-right font-medium text-green-600">
-                            ${category.value.toFixed(2)}
+                            {formatCurrency(category.value)}
                           </td>
                         </tr>
                       ))}
@@ -1238,7 +1235,7 @@ const Reports = () => {
             <Card>
               <CardContent className="p-6 text-center">
                 <div className="text-3xl font-bold text-green-600 mb-2">
-                  ${totalRevenue.toFixed(2)}
+                  {formatCurrency(totalRevenue)}
                 </div>
                 <p className="text-gray-600">{t("total_revenue")}</p>
                 <div className="mt-2 text-sm text-gray-500">
@@ -1250,7 +1247,7 @@ const Reports = () => {
             <Card>
               <CardContent className="p-6 text-center">
                 <div className="text-3xl font-bold text-purple-600 mb-2">
-                  ${totalProfit.toFixed(2)}
+                  {formatCurrency(totalProfit)}
                 </div>
                 <p className="text-gray-600">{t("total_profit_display")}</p>
                 <div className="mt-2 text-sm text-gray-500">
@@ -1262,7 +1259,7 @@ const Reports = () => {
             <Card>
               <CardContent className="p-6 text-center">
                 <div className="text-3xl font-bold text-blue-600 mb-2">
-                  ${averageSaleValue.toFixed(2)}
+                  {formatCurrency(averageSaleValue)}
                 </div>
                 <p className="text-gray-600">{t("avg_sale_value")}</p>
                 <div className="mt-2 text-sm text-gray-500">
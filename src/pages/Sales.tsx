@@ -24,6 +24,7 @@ import {
 import { useToast } from "@/hooks/use-toast";
 import { useLanguage } from "@/contexts/LanguageContext";
 import { Alert, AlertDescription } from "@/components/ui/alert";
+import { formatCurrency } from "@/lib/utils";
 
 interface CartItem {
   productId: string;
@@ -511,8 +512,8 @@ const Sales = () => {
 
       // Success feedback
       const successMessage = paymentMethod === "loan"
-        ? `Loan Created! 🏦 Total: $${calculatedTotal.toFixed(2)} • Customer: ${customerName} • Phone: ${loanCustomerPhone}`
-        : `Sale Completed Successfully! 🎉 Total: $${calculatedTotal.toFixed(2)} • FIFO inventory updated`;
+        ? `Loan Created! 🏦 Total: ${formatCurrency(calculatedTotal)} • Customer: ${customerName} • Phone: ${loanCustomerPhone}`
+        : `Sale Completed Successfully! 🎉 Total: ${formatCurrency(calculatedTotal)} • FIFO inventory updated`;
 
       toast({
         title: paymentMethod === "loan" ? "Loan Sale Created! 🏦" : "Sale Completed Successfully! 🎉",
@@ -600,19 +601,17 @@ const Sales = () => {
         .map((item) => {
           const lineTotal = item.sellPrice * item.quantity;
           return `${item.productName}
-      ${item.quantity} x $${item.sellPrice.toFixed(2)} = $${lineTotal.toFixed(
-            2
-          )}
+      ${item.quantity} x ${formatCurrency(item.sellPrice)} = ${formatCurrency(lineTotal)}
       ${item.barcode ? `Barcode: ${item.barcode}` : ""}
       ${item.hasBatches ? "FIFO Tracked ✓" : ""}`;
         })
         .join("\n      ")}
       
       ====================================
-      Subtotal: $${totalAmount.toFixed(2)}
-      Estimated Profit: $${totalProfit.toFixed(2)}
+      Subtotal: ${formatCurrency(totalAmount)}
+      Estimated Profit: ${formatCurrency(totalProfit)}
       ====================================
-      TOTAL: $${totalAmount.toFixed(2)}
+      TOTAL: ${formatCurrency(totalAmount)}
       ====================================
       
       🏷️  FIFO Inventory System Active
@@ -811,9 +810,8 @@ const Sales = () => {
                   </div>
                   <div className="text-right">
                     <p className="text-lg font-bold text-green-600">
-                      $
-                      {(product.currentSellPrice || product.sellPrice).toFixed(
-                        2
+                      {formatCurrency(
+                        product.currentSellPrice || product.sellPrice
                       )}
                     </p>
                     <p
@@ -825,11 +823,11 @@ const Sales = () => {
                     </p>
                     {product.currentBuyPrice && (
                       <p className="text-xs text-gray-400">
-                        Est. profit: $
-                        {(
+                        Est. profit:{" "}
+                        {formatCurrency(
                           (product.currentSellPrice || product.sellPrice) -
-                          product.currentBuyPrice
-                        ).toFixed(2)}
+                            product.currentBuyPrice
+                        )}
                       </p>
                     )}
                   </div>
@@ -1027,7 +1025,7 @@ const Sales = () => {
                         )}
                       </h4>
                       <div className="flex items-center gap-2 text-sm text-gray-600">
-                        <span>${item.sellPrice} each</span>
+                        <span>{formatCurrency(item.sellPrice)} each</span>
                         {item.barcode && (
                           <Badge
                             variant="outline"
@@ -1039,12 +1037,12 @@ const Sales = () => {
                       </div>
                       <div className="text-xs text-gray-500 space-y-1">
                         <p>
-                          Line total: $
-                          {(item.sellPrice * item.quantity).toFixed(2)}
+                          Line total:{" "}
+                          {formatCurrency(item.sellPrice * item.quantity)}
                         </p>
                         {item.estimatedProfit && (
                           <p className="text-green-600">
-                            Est. profit: ${item.estimatedProfit.toFixed(2)}
+                            Est. profit: {formatCurrency(item.estimatedProfit)}
                           </p>
                         )}
                       </div>
@@ -1117,15 +1115,15 @@ const Sales = () => {
                     <div className="space-y-1 text-xs text-gray-600">
                       <div className="flex justify-between">
                         <span>Total Cost (FIFO):</span>
-                        <span>${preview.totalCost.toFixed(2)}</span>
+                        <span>{formatCurrency(preview.totalCost)}</span>
                       </div>
                       <div className="flex justify-between">
                         <span>Total Revenue:</span>
-                        <span>${preview.totalRevenue.toFixed(2)}</span>
+                        <span>{formatCurrency(preview.totalRevenue)}</span>
                       </div>
                       <div className="flex justify-between font-medium text-green-600">
                         <span>Actual Profit:</span>
-                        <span>${preview.totalProfit.toFixed(2)}</span>
+                        <span>{formatCurrency(preview.totalProfit)}</span>
                       </div>
                     </div>
                   </div>
@@ -1134,10 +1132,9 @@ const Sales = () => {
                   <div className="flex justify-between items-center font-medium text-blue-900">
                     <span>Total FIFO Profit:</span>
                     <span>
-                      $
-                      {fifoPreview
-                        .reduce((sum, p) => sum + p.totalProfit, 0)
-                        .toFixed(2)}
+                      {formatCurrency(
+                        fifoPreview.reduce((sum, p) => sum + p.totalProfit, 0)
+                      )}
                     </span>
                   </div>
                 </div>
@@ -1171,7 +1168,7 @@ const Sales = () => {
                       )}
                     </span>
                     <span className="font-medium">
-                      ${(item.sellPrice * item.quantity).toFixed(2)}
+                      {formatCurrency(item.sellPrice * item.quantity)}
                     </span>
                   </div>
                 ))}
@@ -1180,7 +1177,7 @@ const Sales = () => {
                   <div className="flex justify-between items-center">
                     <span>Subtotal:</span>
                     <span className="font-medium">
-                      ${cartSummary.totalAmount.toFixed(2)}
+                      {formatCurrency(cartSummary.totalAmount)}
                     </span>
                   </div>
 
@@ -1188,7 +1185,7 @@ const Sales = () => {
                     <div className="flex justify-between items-center text-sm text-green-600">
                       <span>Est. Profit (FIFO):</span>
                       <span className="font-medium">
-                        ${cartSummary.totalProfit.toFixed(2)}
+                        {formatCurrency(cartSummary.totalProfit)}
                       </span>
                     </div>
                   )}
@@ -1196,7 +1193,7 @@ const Sales = () => {
                   <div className="flex justify-between items-center text-lg font-bold border-t pt-2">
                     <span>Total:</span>
                     <span className="text-green-600">
-                      ${cartSummary.totalAmount.toFixed(2)}
+                      {formatCurrency(cartSummary.totalAmount)}
                     </span>
                   </div>
                 </div>
@@ -1270,12 +1267,12 @@ const Sales = () => {
                   allocation
                 </p>
                 <p>
-                  📦 {cartSummary.itemCount} items • $
-                  {cartSummary.totalAmount.toFixed(2)} total
+                  📦 {cartSummary.itemCount} items •{" "}
+                  {formatCurrency(cartSummary.totalAmount)} total
                 </p>
                 <p>📊 {cartSummary.fifoItemsCount} items with batch tracking</p>
                 <p>
-                  💰 Estimated profit: ${cartSummary.totalProfit.toFixed(2)}
+                  💰 Estimated profit: {formatCurrency(cartSummary.totalProfit)}
                 </p>
 
                 {cart.some(